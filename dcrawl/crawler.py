@@ -1,19 +1,110 @@
 """Simple web crawler with element analysis."""
 
 import asyncio
-from typing import Dict, List, Optional, Tuple
-from playwright.async_api import async_playwright, Browser, Page
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .exceptions import CrawlingError
 
 logger = logging.getLogger(__name__)
 
+# Selectors for different element types, in extraction order
+SELECTORS = [
+    ('nav, [role="navigation"]', 'navigation'),
+    ('h1, h2, h3, h4, h5, h6', 'header'),
+    ('button, [role="button"]', 'button'),
+    ('a[href]', 'link'),
+    ('img[src]', 'image'),
+    ('input, textarea, select', 'form'),
+    ('p, span, div', 'content'),
+]
 
-@dataclass
-class Element:
+# Elements examined per category
+MAX_ELEMENTS_PER_CATEGORY = 10
+
+# Runs every selector in the page and returns plain element data in one round-trip
+EXTRACT_ELEMENTS_JS = '''(selectors) => {
+    const out = [];
+    for (const [selector, category] of selectors) {
+        const nodes = Array.from(document.querySelectorAll(selector)).slice(0, %d);
+        for (const el of nodes) {
+            const rect = el.getBoundingClientRect();
+            const computed = window.getComputedStyle(el);
+            const text = (el.textContent || '').trim().substring(0, 100);
+            
+            // Skip invisible and empty elements before they are serialized
+            if (!rect.width || !rect.height || computed.display === 'none' || !text) {
+                continue;
+            }
+            
+            // Only the attributes the generator reads
+            const attrs = {};
+            for (const name of ['href', 'src', 'alt', 'type', 'placeholder']) {
+                const value = el.getAttribute(name);
+                if (value !== null) {
+                    attrs[name] = value;
+                }
+            }
+            
+            // Styles used for Tailwind mapping
+            const styles = {
+                display: computed.display,
+                padding: computed.padding,
+                fontSize: computed.fontSize,
+                fontWeight: computed.fontWeight,
+                color: computed.color,
+                backgroundColor: computed.backgroundColor,
+                borderRadius: computed.borderRadius,
+                boxShadow: computed.boxShadow
+            };
+            
+            out.push({
+                tag: el.tagName.toLowerCase(),
+                text: text,
+                classes: typeof el.className === 'string' ? el.className : '',
+                styles: styles,
+                attributes: attrs,
+                position: {
+                    x: rect.x,
+                    y: rect.y,
+                    width: rect.width,
+                    height: rect.height
+                },
+                category: category
+            });
+        }
+    }
+    return out;
+}''' % MAX_ELEMENTS_PER_CATEGORY
+
+# Resource types that never affect element extraction
+BLOCKED_RESOURCE_TYPES = {
+    'image', 'font', 'media', 'beacon', 'csp_report', 'imageset', 'texttrack'
+}
+
+
+class _FrozenSlots:
+    """Copy/pickle support for frozen dataclasses with hand-written __slots__."""
+    __slots__ = ()
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+        
+    def __setstate__(self, state):
+        # The frozen __setattr__ would reject the default slot-state restore
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class Element(_FrozenSlots):
     """Simplified element data structure."""
+    __slots__ = ('tag', 'text', 'classes', 'styles', 'attributes', 'position', 'category')
+    
     tag: str
     text: str
     classes: str
@@ -23,153 +114,178 @@ class Element:
     category: str
 
 
-@dataclass
-class CrawlResult:
+@dataclass(frozen=True)
+class CrawlResult(_FrozenSlots):
     """Result of crawling a website."""
+    __slots__ = ('url', 'title', 'elements')
+    
     url: str
     title: str
     elements: List[Element]
 
 
+@dataclass
+class ElementTable:
+    """Column-wise (struct-of-arrays) view of a list of elements.
+    
+    Used by numeric consumers such as dcrawl.scoring; the generator works on
+    Element objects directly.
+    """
+    tags: List[str] = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+    styles: List[Dict[str, str]] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    positions: List[Dict[str, float]] = field(default_factory=list)
+    
+    @classmethod
+    def from_elements(cls, elements: List[Element]) -> 'ElementTable':
+        """Build a table from a list of elements."""
+        return cls(
+            tags=[e.tag for e in elements],
+            texts=[e.text for e in elements],
+            styles=[e.styles for e in elements],
+            categories=[e.category for e in elements],
+            positions=[e.position for e in elements]
+        )
+        
+    def __len__(self) -> int:
+        return len(self.tags)
+
+
 class WebCrawler:
     """Simple web crawler with built-in analysis."""
     
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    def __init__(self, headless: bool = True, timeout: int = 30000, block_css: bool = False,
+                 concurrency: int = 4):
         self.headless = headless
         self.timeout = timeout
+        self.block_css = block_css
+        self.concurrency = concurrency
+        self.playwright = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.blocked_types = BLOCKED_RESOURCE_TYPES | ({'stylesheet'} if block_css else set())
         
     async def __aenter__(self):
         """Async context manager entry."""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=self.headless)
+        try:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
+            
+            # One shared context; pages opened from it inherit the resource blocking
+            self.context = await self.browser.new_context(
+                java_script_enabled=True,
+                viewport={'width': 1280, 'height': 800},
+                bypass_csp=True
+            )
+            await self.context.route('**/*', self._route_handler)
+        except BaseException:
+            # __aexit__ won't run if entry fails, so release what was started
+            await self._close()
+            raise
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self._close()
+        
+    async def _close(self):
+        """Close the context, browser and Playwright driver, whichever were started."""
+        if self.context:
+            await self.context.close()
+            self.context = None
         if self.browser:
             await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
             
     async def crawl(self, url: str) -> CrawlResult:
         """Crawl a website and return analyzed elements."""
-        if not self.browser:
+        if not self.context:
             raise CrawlingError("Browser not initialized")
             
         logger.info(f"Starting crawl of {url}")
         
+        page = await self.context.new_page()
         try:
-            page = await self.browser.new_page()
-            
-            # Navigate to page
-            response = await page.goto(url, timeout=self.timeout)
+            # Navigate to page; don't wait for scripts, iframes or stylesheets to finish
+            response = await page.goto(url, timeout=self.timeout, wait_until='domcontentloaded')
             if not response or response.status >= 400:
                 raise CrawlingError(f"Failed to load {url}: HTTP {response.status if response else 'No response'}")
                 
             # Wait for content
-            await page.wait_for_load_state('networkidle', timeout=15000)
-            await asyncio.sleep(2)  # Additional wait
-            
-            # Get page title
-            title = await page.title()
+            try:
+                await page.wait_for_function(
+                    "document.body && document.body.children.length > 0", timeout=3000
+                )
+            except PlaywrightTimeoutError:
+                logger.debug(f"Body still empty on {url}, extracting anyway")
             
-            # Extract elements
-            elements = await self._extract_elements(page)
+            # Get page title and extract elements concurrently
+            title, elements = await asyncio.gather(
+                page.title(),
+                self._extract_elements(page)
+            )
             
             logger.info(f"Successfully extracted {len(elements)} elements from {url}")
             
-            await page.close()
             return CrawlResult(url=url, title=title, elements=elements)
             
         except Exception as e:
             logger.error(f"Error crawling {url}: {e}")
             raise CrawlingError(f"Failed to crawl {url}: {e}")
+        finally:
+            await page.close()
             
-    async def _extract_elements(self, page: Page) -> List[Element]:
-        """Extract and analyze elements from the page."""
-        # Define selectors for different element types
-        selectors = [
-            ('nav, [role="navigation"]', 'navigation'),
-            ('h1, h2, h3, h4, h5, h6', 'header'),
-            ('button, [role="button"]', 'button'),
-            ('a[href]', 'link'),
-            ('img[src]', 'image'),
-            ('input, textarea, select', 'form'),
-            ('p, span, div', 'content'),
-        ]
+    async def crawl_many(self, urls: List[str],
+                         on_result: Optional[Callable[[int, CrawlResult], Awaitable[Any]]] = None) -> List[Any]:
+        """Crawl several websites concurrently, at most `concurrency` pages at a time.
         
-        elements = []
+        Returns one outcome per URL, in order: the CrawlResult, or the value of
+        `on_result(index, result)` when given. The callback runs outside the
+        concurrency limit so it overlaps the next crawl. A failure is returned
+        in place as its exception instead of aborting the other crawls.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        for selector, category in selectors:
-            try:
-                handles = await page.query_selector_all(selector)
-                for handle in handles[:10]:  # Limit to 10 per category
-                    element = await self._extract_element_data(handle, category)
-                    if element:
-                        elements.append(element)
-            except Exception as e:
-                logger.debug(f"Error extracting {category} elements: {e}")
-                continue
-                
-        return elements
+        async def bounded_crawl(index: int, url: str) -> Any:
+            async with semaphore:
+                result = await self.crawl(url)
+            if on_result is not None:
+                return await on_result(index, result)
+            return result
+            
+        return await asyncio.gather(
+            *(bounded_crawl(i, url) for i, url in enumerate(urls)),
+            return_exceptions=True
+        )
         
-    async def _extract_element_data(self, element_handle, category: str) -> Optional[Element]:
-        """Extract data from a single element."""
+    async def _route_handler(self, route: Route):
+        """Abort requests for resource types that don't affect extraction."""
+        if route.request.resource_type in self.blocked_types:
+            await route.abort()
+        else:
+            await route.continue_()
+            
+    async def _extract_elements(self, page: Page) -> List[Element]:
+        """Extract and analyze elements from the page in a single evaluate call."""
         try:
-            data = await element_handle.evaluate('''(el) => {
-                const rect = el.getBoundingClientRect();
-                const computed = window.getComputedStyle(el);
-                
-                // Extract attributes
-                const attrs = {};
-                for (const attr of el.attributes || []) {
-                    attrs[attr.name] = attr.value;
-                }
-                
-                // Key styles
-                const styles = {
-                    display: computed.display,
-                    position: computed.position,
-                    width: computed.width,
-                    height: computed.height,
-                    padding: computed.padding,
-                    margin: computed.margin,
-                    fontSize: computed.fontSize,
-                    fontWeight: computed.fontWeight,
-                    color: computed.color,
-                    backgroundColor: computed.backgroundColor,
-                    borderRadius: computed.borderRadius,
-                    boxShadow: computed.boxShadow
-                };
-                
-                return {
-                    tag: el.tagName.toLowerCase(),
-                    text: (el.textContent || '').trim().substring(0, 100),
-                    classes: el.className || '',
-                    styles: styles,
-                    attributes: attrs,
-                    position: {
-                        x: rect.x,
-                        y: rect.y,
-                        width: rect.width,
-                        height: rect.height
-                    },
-                    visible: rect.width > 0 && rect.height > 0 && computed.display !== 'none'
-                };
-            }''')
+            data = await page.evaluate(EXTRACT_ELEMENTS_JS, [list(s) for s in SELECTORS])
+        except PlaywrightError as e:
+            logger.debug(f"Error extracting elements: {e}")
+            return []
             
-            if not data['visible'] or not data['text']:
-                return None
-                
-            return Element(
-                tag=data['tag'],
-                text=data['text'],
-                classes=data['classes'],
-                styles=data['styles'],
-                attributes=data['attributes'],
-                position=data['position'],
-                category=category
+        return [
+            Element(
+                tag=item['tag'],
+                text=item['text'],
+                classes=item['classes'],
+                styles=item['styles'],
+                attributes=item['attributes'],
+                position=item['position'],
+                category=item['category']
             )
-            
-        except Exception as e:
-            logger.debug(f"Failed to extract element data: {e}")
-            return None
\ No newline at end of file
+            for item in data
+        ]
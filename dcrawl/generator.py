@@ -1,25 +1,188 @@
 """Simple React component generator with Tailwind CSS."""
 
+import io
 import re
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict
+from functools import lru_cache
+from typing import Callable, List, Dict, Tuple
 from .crawler import Element, CrawlResult
 from .exceptions import GenerationError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Class names that look like Tailwind utilities, combined into one regex
+_TAILWIND_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'^(p|m|px|py|mx|my|pt|pb|pl|pr|mt|mb|ml|mr)-\d+$',
+    r'^text-(xs|sm|base|lg|xl|2xl|3xl|4xl|5xl|6xl)$',
+    r'^text-(black|white|gray|red|blue|green|yellow)-\d+$',
+    r'^bg-(black|white|gray|red|blue|green|yellow)-\d+$',
+    r'^font-(thin|light|normal|medium|semibold|bold|extrabold|black)$',
+    r'^(flex|block|inline|hidden|relative|absolute|fixed)$',
+    r'^rounded(-sm|-md|-lg|-xl|-full)?$',
+    r'^shadow(-sm|-md|-lg|-xl|-2xl)?$'
+)))
+
+# Fixed JSX scaffolding around the generated elements
+_NAV_OPEN = (
+    '      {/* Navigation */}\n'
+    '      <nav className="flex items-center justify-between px-6 py-4 border-b">\n'
+)
+_NAV_CLOSE = '      </nav>\n\n'
+_HEADER_OPEN = (
+    '      {/* Headers */}\n'
+    '      <header className="container mx-auto px-6 py-8">\n'
+)
+_HEADER_CLOSE = '      </header>\n\n'
+_MAIN_OPEN = (
+    '      {/* Main Content */}\n'
+    '      <main className="container mx-auto px-6 py-8">\n'
+)
+_MAIN_CLOSE = '      </main>'
+_SECTION_OPEN = '        <section className="mb-6">\n'
+_SECTION_CLOSE = '        </section>\n\n'
+
+# Output templates, filled with str.format
+_COMPONENT_TMPL = """// Generated by design-by-crawling
+// Generated on: {timestamp}
+// Source: {source}
+
+import React from 'react';
+
+function {name}() {{
+  return (
+    <div className="min-h-screen bg-white">
+{jsx}
+    </div>
+  );
+}}
+
+export default {name};"""
+
+_REGULAR_TMPL = '<{tag} className="{classes}">{text}</{tag}>'
+_ANCHOR_TMPL = '<a className="{classes}" href="{href}">{text}</a>'
+_VOID_TMPL = '<{tag} className="{classes}" />'
+_IMG_TMPL = '<img className="{classes}" src="{src}" alt="{alt}" />'
+_INPUT_TMPL = '<input className="{classes}" type="{type}" />'
+_INPUT_PLACEHOLDER_TMPL = '<input className="{classes}" type="{type}" placeholder="{placeholder}" />'
+
+# Text cleanup for JSX: escape quotes, then collapse whitespace
+_TEXT_TRANS = str.maketrans({'"': '\\"', '\n': ' ', '\r': ' ', '\t': ' '})
+_WS_RE = re.compile(r'\s+')
+
+# Computed style values mapped straight to Tailwind classes
+_DISPLAY_MAP = {
+    'flex': 'flex',
+    'inline-flex': 'flex',
+    'block': 'block',
+    'inline-block': 'block',
+}
+
+_FONT_SIZE_MAP = {
+    '24px': 'text-2xl',
+    '2rem': 'text-2xl',
+    '20px': 'text-xl',
+    '18px': 'text-lg',
+    '14px': 'text-sm',
+}
+
+_FONT_WEIGHT_MAP = {
+    '700': 'font-bold',
+    'bold': 'font-bold',
+    '600': 'font-medium',
+    '500': 'font-medium',
+}
+
+_COLOR_MAP = {
+    'rgb(0, 0, 0)': 'text-black',
+    '#000': 'text-black',
+    'rgb(255, 255, 255)': 'text-white',
+    '#fff': 'text-white',
+}
+
+_BG_MAP = {
+    'rgb(255, 255, 255)': 'bg-white',
+    '#fff': 'bg-white',
+    'rgb(0, 0, 0)': 'bg-black',
+    '#000': 'bg-black',
+}
+
+_PADDING_MAP = {
+    '16px': 'p-4',
+    '1rem': 'p-4',
+    '8px': 'p-2',
+}
+
+
+def _truncate(text: str) -> str:
+    """Shorten long element text for display."""
+    return text[:50] + "..." if len(text) > 50 else text
+
+
+def _jsx_regular(element: Element, classes: str, text: str) -> str:
+    """JSX for a regular tag with text content."""
+    return _REGULAR_TMPL.format(tag=element.tag, classes=classes, text=_truncate(text))
+
+
+def _jsx_anchor(element: Element, classes: str, text: str) -> str:
+    """JSX for a link, keeping only absolute hrefs."""
+    href = element.attributes.get('href')
+    if not href:
+        return _REGULAR_TMPL.format(tag='a', classes=classes, text=_truncate(text))
+    if not href.startswith('http'):
+        href = '#'
+    return _ANCHOR_TMPL.format(classes=classes, href=href, text=_truncate(text))
+
+
+def _jsx_img(element: Element, classes: str, text: str) -> str:
+    """JSX for a self-closing image."""
+    src = element.attributes.get('src')
+    if not src:
+        return _VOID_TMPL.format(tag='img', classes=classes)
+    return _IMG_TMPL.format(classes=classes, src=src, alt=element.attributes.get('alt', ''))
+
+
+def _jsx_input(element: Element, classes: str, text: str) -> str:
+    """JSX for a self-closing input."""
+    attributes = element.attributes
+    placeholder = attributes.get('placeholder')
+    if not placeholder:
+        return _INPUT_TMPL.format(classes=classes, type=attributes.get('type', 'text'))
+    return _INPUT_PLACEHOLDER_TMPL.format(
+        classes=classes, type=attributes.get('type', 'text'), placeholder=placeholder
+    )
+
+
+def _jsx_void(element: Element, classes: str, text: str) -> str:
+    """JSX for a self-closing tag without special attributes."""
+    return _VOID_TMPL.format(tag=element.tag, classes=classes)
+
+
+# Tag -> specialized JSX emitter; everything else uses _jsx_regular
+_JSX_HANDLERS = {
+    'a': _jsx_anchor,
+    'img': _jsx_img,
+    'input': _jsx_input,
+    'br': _jsx_void,
+    'hr': _jsx_void,
+}
+
 
 class ReactGenerator:
     """Simple React component generator with Tailwind CSS."""
     
     def __init__(self, component_name: str = "GeneratedComponent"):
         self.component_name = component_name
+        self._class_cache: Dict[Tuple[str, ...], str] = {}
         
     def generate(self, crawl_result: CrawlResult) -> str:
         """Generate React component from crawl result."""
         logger.info(f"Generating React component: {self.component_name}")
         
+        # Style fingerprint -> class string, scoped to this crawl result
+        self._class_cache = {}
+        
         try:
             # Group elements by category
             grouped = self._group_elements(crawl_result.elements)
@@ -39,38 +202,32 @@ class ReactGenerator:
             
     def _group_elements(self, elements: List[Element]) -> Dict[str, List[Element]]:
         """Group elements by category."""
-        grouped = {}
+        grouped = defaultdict(list)
         for element in elements:
-            if element.category not in grouped:
-                grouped[element.category] = []
             grouped[element.category].append(element)
-        return grouped
+        return dict(grouped)
         
     def _generate_jsx(self, grouped_elements: Dict[str, List[Element]]) -> str:
         """Generate JSX content from grouped elements."""
-        jsx_parts = []
+        buf = io.StringIO()
+        w = buf.write
         
         # Navigation first
         if 'navigation' in grouped_elements:
-            jsx_parts.append('      {/* Navigation */}')
-            jsx_parts.append('      <nav className="flex items-center justify-between px-6 py-4 border-b">')
+            w(_NAV_OPEN)
             for element in grouped_elements['navigation'][:3]:
-                jsx_parts.append(f'        {self._element_to_jsx(element, 8)}')
-            jsx_parts.append('      </nav>')
-            jsx_parts.append('')
+                self._element_to_jsx(element, w, 8)
+            w(_NAV_CLOSE)
         
         # Headers
         if 'header' in grouped_elements:
-            jsx_parts.append('      {/* Headers */}')
-            jsx_parts.append('      <header className="container mx-auto px-6 py-8">')
+            w(_HEADER_OPEN)
             for element in grouped_elements['header'][:5]:
-                jsx_parts.append(f'        {self._element_to_jsx(element, 8)}')
-            jsx_parts.append('      </header>')
-            jsx_parts.append('')
+                self._element_to_jsx(element, w, 8)
+            w(_HEADER_CLOSE)
         
         # Main content
-        jsx_parts.append('      {/* Main Content */}')
-        jsx_parts.append('      <main className="container mx-auto px-6 py-8">')
+        w(_MAIN_OPEN)
         
         # Other categories
         for category, elements in grouped_elements.items():
@@ -78,21 +235,22 @@ class ReactGenerator:
                 continue
                 
             if elements:
-                jsx_parts.append(f'        {{/* {category.title()} */}}')
-                jsx_parts.append('        <section className="mb-6">')
+                w('        {/* ')
+                w(category.title())
+                w(' */}\n')
+                w(_SECTION_OPEN)
                 
                 for element in elements[:5]:  # Limit elements per section
-                    jsx_parts.append(f'          {self._element_to_jsx(element, 10)}')
+                    self._element_to_jsx(element, w, 10)
                     
-                jsx_parts.append('        </section>')
-                jsx_parts.append('')
+                w(_SECTION_CLOSE)
         
-        jsx_parts.append('      </main>')
+        w(_MAIN_CLOSE)
         
-        return '\n'.join(jsx_parts)
+        return buf.getvalue()
         
-    def _element_to_jsx(self, element: Element, indent: int = 6) -> str:
-        """Convert element to JSX."""
+    def _element_to_jsx(self, element: Element, write: Callable[[str], int], indent: int = 6) -> None:
+        """Write element as an indented line of JSX."""
         indent_str = ' ' * indent
         
         # Get Tailwind classes
@@ -101,161 +259,107 @@ class ReactGenerator:
         # Clean text
         text = self._clean_text(element.text)
         
-        # Self-closing tags
-        if element.tag in ['img', 'input', 'br', 'hr']:
-            attrs = self._get_jsx_attributes(element, classes)
-            return f'<{element.tag}{attrs} />'
-        
-        # Regular tags
-        attrs = self._get_jsx_attributes(element, classes)
-        if len(text) > 50:
-            text = text[:50] + "..."
-            
-        return f'<{element.tag}{attrs}>{text}</{element.tag}>'
+        # Tag-specific emitter
+        handler = _JSX_HANDLERS.get(element.tag, _jsx_regular)
+        write(f'{indent_str}{handler(element, classes, text)}\n')
         
     def _generate_tailwind_classes(self, element: Element) -> str:
         """Generate Tailwind classes from element styles."""
+        get = element.styles.get
+        key = (
+            get('display', ''), get('fontSize', ''), get('fontWeight', ''), get('color', ''),
+            get('backgroundColor', ''), get('padding', ''), get('borderRadius', ''),
+            get('boxShadow', ''), element.classes or ''
+        )
+        classes = self._class_cache.get(key)
+        if classes is None:
+            classes = self._class_cache[key] = self._classes_for(key)
+        return classes
+        
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _classes_for(key: Tuple[str, ...]) -> str:
+        """Generate Tailwind classes for a (styles..., classes) fingerprint tuple."""
+        (display, font_size, font_weight, color, bg_color,
+         padding, border_radius, box_shadow, existing) = key
         classes = []
-        styles = element.styles
         
         # Layout
-        if 'flex' in styles.get('display', ''):
-            classes.append('flex')
-        elif 'block' in styles.get('display', ''):
-            classes.append('block')
+        cls = _DISPLAY_MAP.get(display)
+        if cls:
+            classes.append(cls)
             
         # Typography
-        font_size = styles.get('fontSize', '')
-        if '24px' in font_size or '2rem' in font_size:
-            classes.append('text-2xl')
-        elif '20px' in font_size:
-            classes.append('text-xl')
-        elif '18px' in font_size:
-            classes.append('text-lg')
-        elif '14px' in font_size:
-            classes.append('text-sm')
+        cls = _FONT_SIZE_MAP.get(font_size)
+        if cls:
+            classes.append(cls)
             
-        font_weight = styles.get('fontWeight', '')
-        if font_weight in ['700', 'bold']:
-            classes.append('font-bold')
-        elif font_weight in ['600', '500']:
-            classes.append('font-medium')
+        cls = _FONT_WEIGHT_MAP.get(font_weight)
+        if cls:
+            classes.append(cls)
             
         # Colors
-        color = styles.get('color', '')
-        if 'rgb(0, 0, 0)' in color or '#000' in color:
-            classes.append('text-black')
-        elif 'rgb(255, 255, 255)' in color or '#fff' in color:
-            classes.append('text-white')
+        cls = _COLOR_MAP.get(color)
+        if cls:
+            classes.append(cls)
         elif 'gray' in color or 'grey' in color:
             classes.append('text-gray-600')
             
-        bg_color = styles.get('backgroundColor', '')
-        if 'rgb(255, 255, 255)' in bg_color or '#fff' in bg_color:
-            classes.append('bg-white')
-        elif 'rgb(0, 0, 0)' in bg_color or '#000' in bg_color:
-            classes.append('bg-black')
+        cls = _BG_MAP.get(bg_color)
+        if cls:
+            classes.append(cls)
             
         # Spacing - simplified
-        padding = styles.get('padding', '')
         if padding and padding != '0px':
-            if '16px' in padding or '1rem' in padding:
-                classes.append('p-4')
-            elif '8px' in padding:
-                classes.append('p-2')
-            else:
-                classes.append('p-2')
+            classes.append(_PADDING_MAP.get(padding, 'p-2'))
                 
         # Border radius
-        border_radius = styles.get('borderRadius', '')
         if border_radius and border_radius != '0px':
             classes.append('rounded')
             
         # Box shadow
-        box_shadow = styles.get('boxShadow', '')
         if box_shadow and box_shadow != 'none':
             classes.append('shadow')
             
         # Use existing classes if they look like Tailwind
-        existing_classes = element.classes.split() if element.classes else []
-        for cls in existing_classes:
-            if self._is_tailwind_class(cls):
+        for cls in existing.split():
+            if ReactGenerator._is_tailwind_class(cls):
                 classes.append(cls)
                 
-        # Remove duplicates and limit
-        classes = list(dict.fromkeys(classes))[:8]  # Keep unique, limit to 8
-        
-        return ' '.join(classes) if classes else 'p-2'
+        # Remove duplicates and limit to 8
+        seen = set()
+        unique = []
+        for cls in classes:
+            if cls in seen:
+                continue
+            seen.add(cls)
+            unique.append(cls)
+            if len(unique) == 8:
+                break
+                
+        return ' '.join(unique) if unique else 'p-2'
         
-    def _is_tailwind_class(self, cls: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_tailwind_class(cls: str) -> bool:
         """Check if a class looks like Tailwind CSS."""
-        tailwind_patterns = [
-            r'^(p|m|px|py|mx|my|pt|pb|pl|pr|mt|mb|ml|mr)-\d+$',
-            r'^text-(xs|sm|base|lg|xl|2xl|3xl|4xl|5xl|6xl)$',
-            r'^text-(black|white|gray|red|blue|green|yellow)-\d+$',
-            r'^bg-(black|white|gray|red|blue|green|yellow)-\d+$',
-            r'^font-(thin|light|normal|medium|semibold|bold|extrabold|black)$',
-            r'^(flex|block|inline|hidden|relative|absolute|fixed)$',
-            r'^rounded(-sm|-md|-lg|-xl|-full)?$',
-            r'^shadow(-sm|-md|-lg|-xl|-2xl)?$'
-        ]
-        return any(re.match(pattern, cls) for pattern in tailwind_patterns)
-        
-    def _get_jsx_attributes(self, element: Element, classes: str) -> str:
-        """Get JSX attributes for element."""
-        attrs = []
-        
-        if classes:
-            attrs.append(f'className="{classes}"')
-            
-        # Special attributes
-        if element.tag == 'a' and element.attributes.get('href'):
-            href = element.attributes['href']
-            if href.startswith('http'):
-                attrs.append(f'href="{href}"')
-            else:
-                attrs.append('href="#"')
-                
-        if element.tag == 'img' and element.attributes.get('src'):
-            attrs.append(f'src="{element.attributes["src"]}"')
-            attrs.append(f'alt="{element.attributes.get("alt", "")}"')
-            
-        if element.tag == 'input':
-            attrs.append(f'type="{element.attributes.get("type", "text")}"')
-            if element.attributes.get('placeholder'):
-                attrs.append(f'placeholder="{element.attributes["placeholder"]}"')
-                
-        return ' ' + ' '.join(attrs) if attrs else ''
+        return bool(_TAILWIND_RE.match(cls))
         
     def _clean_text(self, text: str) -> str:
         """Clean text for JSX."""
         if not text:
             return ""
             
-        # Clean and escape
-        text = text.strip()
-        text = text.replace('"', '\\"')
-        text = text.replace('\n', ' ')
-        text = re.sub(r'\s+', ' ', text)  # Collapse whitespace
-        
-        return text
+        # Escape quotes, collapse whitespace
+        return _WS_RE.sub(' ', text.translate(_TEXT_TRANS)).strip()
         
     def _generate_component(self, jsx_content: str, source_url: str) -> str:
         """Generate complete React component."""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        return f'''// Generated by design-by-crawling
-// Generated on: {timestamp}
-// Source: {source_url}
-
-import React from 'react';
-
-function {self.component_name}() {{
-  return (
-    <div className="min-h-screen bg-white">
-{jsx_content}
-    </div>
-  );
-}}
-
-export default {self.component_name};'''
\ No newline at end of file
+        return _COMPONENT_TMPL.format(
+            name=self.component_name,
+            jsx=jsx_content,
+            timestamp=timestamp,
+            source=source_url
+        )
\ No newline at end of file
@@ -4,12 +4,12 @@ import argparse
 import asyncio
 import sys
 import logging
-from typing import Optional
+from typing import List, Optional, Union
 
-from .crawler import WebCrawler
+from .crawler import WebCrawler, CrawlResult
 from .generator import ReactGenerator
 from .utils import (
-    setup_logging, save_file, load_config, save_default_config,
+    setup_logging, save_file_async, load_config, save_default_config,
     validate_url, get_output_filename
 )
 from .exceptions import DCrawlError, ConfigError
@@ -28,12 +28,13 @@ Examples:
   python dcrawl.py https://example.com
   python dcrawl.py https://example.com --name MyComponent
   python dcrawl.py https://example.com --output ./components/
+  python dcrawl.py https://example.com https://example.org  # Batch mode
   python dcrawl.py init  # Generate config file
         """
     )
     
     # Special case for init command
-    parser.add_argument('url_or_init', nargs='?', help='Website URL to crawl, or "init" to generate config')
+    parser.add_argument('url_or_init', nargs='*', help='Website URL(s) to crawl, or "init" to generate config')
     parser.add_argument('--name', '-n', help='Component name (default: GeneratedComponent)')
     parser.add_argument('--output', '-o', help='Output directory (default: ./generated)')
     parser.add_argument('--config', '-c', help='Configuration file path')
@@ -44,18 +45,20 @@ Examples:
     return parser
 
 
-async def crawl_website(url: str, config: dict, component_name: str, output_dir: str, verbose: bool = False) -> str:
-    """Crawl website and generate component."""
-    setup_logging(verbose)
-    
-    logger.info(f"🔍 Starting crawl of {url}")
-    
-    # Crawl website
-    async with WebCrawler(headless=config['headless'], timeout=config['timeout']) as crawler:
-        crawl_result = await crawler.crawl(url)
-        
+def _create_crawler(config: dict) -> WebCrawler:
+    """Create a crawler from configuration."""
+    return WebCrawler(
+        headless=config['headless'],
+        timeout=config['timeout'],
+        block_css=config.get('block_css', False),
+        concurrency=config.get('concurrency', 4)
+    )
+
+
+async def _generate_and_save(crawl_result: CrawlResult, component_name: str, output_dir: str) -> str:
+    """Generate a component from a crawl result and save it."""
     if not crawl_result.elements:
-        raise DCrawlError("No elements extracted from the website")
+        raise DCrawlError(f"No elements extracted from {crawl_result.url}")
         
     logger.info(f"✅ Extracted {len(crawl_result.elements)} elements")
     
@@ -75,7 +78,7 @@ async def crawl_website(url: str, config: dict, component_name: str, output_dir:
     
     # Save file
     output_file = get_output_filename(component_name, output_dir)
-    saved_path = save_file(component_code, output_file)
+    saved_path = await save_file_async(component_code, output_file)
     
     logger.info(f"✨ Component generated successfully!")
     logger.info(f"💾 Saved to: {saved_path}")
@@ -83,6 +86,36 @@ async def crawl_website(url: str, config: dict, component_name: str, output_dir:
     return saved_path
 
 
+async def crawl_website(url: str, config: dict, component_name: str, output_dir: str, verbose: bool = False) -> str:
+    """Crawl website and generate component."""
+    setup_logging(verbose)
+    
+    logger.info(f"🔍 Starting crawl of {url}")
+    
+    # Crawl website
+    async with _create_crawler(config) as crawler:
+        crawl_result = await crawler.crawl(url)
+        
+    return await _generate_and_save(crawl_result, component_name, output_dir)
+
+
+async def crawl_websites(urls: List[str], config: dict, component_names: List[str], output_dir: str,
+                         verbose: bool = False) -> List[Union[str, BaseException]]:
+    """Crawl several websites concurrently and generate one component per URL.
+    
+    Returns the saved path for each URL, or the exception that URL failed with.
+    """
+    setup_logging(verbose)
+    
+    logger.info(f"🔍 Starting crawl of {len(urls)} websites")
+    
+    async def save_component(index: int, crawl_result: CrawlResult) -> str:
+        return await _generate_and_save(crawl_result, component_names[index], output_dir)
+        
+    async with _create_crawler(config) as crawler:
+        return await crawler.crawl_many(urls, on_result=save_component)
+
+
 def handle_init_command(output_path: str) -> None:
     """Handle init command."""
     config_path = save_default_config(output_path)
@@ -90,14 +123,24 @@ def handle_init_command(output_path: str) -> None:
     print(f"📝 Edit the file and use with: python dcrawl.py <url> --config {config_path}")
 
 
+def print_success(component_name: str, saved_path: str, url: str) -> None:
+    """Print success message for a generated component."""
+    print(f"\n{'='*50}")
+    print(f"✅ Successfully generated {component_name}")
+    print(f"📄 File: {saved_path}")
+    print(f"🔗 Source: {url}")
+    print(f"{'='*50}\n")
+
+
 def handle_crawl_command(args, config: dict) -> None:
     """Handle crawl command."""
-    url = args.url
+    urls = args.urls
     
-    if not validate_url(url):
-        print(f"❌ Error: Invalid URL: {url}")
-        print("📝 URL must start with http:// or https://")
-        sys.exit(1)
+    for url in urls:
+        if not validate_url(url):
+            print(f"❌ Error: Invalid URL: {url}")
+            print("📝 URL must start with http:// or https://")
+            sys.exit(1)
     
     # Override config with CLI args
     component_name = args.name or config.get('component_name', 'GeneratedComponent')
@@ -105,21 +148,26 @@ def handle_crawl_command(args, config: dict) -> None:
     
     try:
         # Run async crawl
-        saved_path = asyncio.run(crawl_website(
-            url=url,
+        if len(urls) == 1:
+            saved_path = asyncio.run(crawl_website(
+                url=urls[0],
+                config=config,
+                component_name=component_name,
+                output_dir=output_dir,
+                verbose=args.verbose
+            ))
+            print_success(component_name, saved_path, urls[0])
+            return
+            
+        component_names = [f"{component_name}{i}" for i in range(1, len(urls) + 1)]
+        outcomes = asyncio.run(crawl_websites(
+            urls=urls,
             config=config,
-            component_name=component_name,
+            component_names=component_names,
             output_dir=output_dir,
             verbose=args.verbose
         ))
         
-        # Print success message
-        print(f"\n{'='*50}")
-        print(f"✅ Successfully generated {component_name}")
-        print(f"📄 File: {saved_path}")
-        print(f"🔗 Source: {url}")
-        print(f"{'='*50}\n")
-        
     except DCrawlError as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
@@ -132,6 +180,27 @@ def handle_crawl_command(args, config: dict) -> None:
             import traceback
             traceback.print_exc()
         sys.exit(1)
+        
+    # Report each URL of the batch
+    failures = []
+    for url, name, outcome in zip(urls, component_names, outcomes):
+        if isinstance(outcome, BaseException):
+            failures.append((url, outcome))
+        else:
+            print_success(name, outcome, url)
+            
+    for url, error in failures:
+        if isinstance(error, DCrawlError):
+            print(f"❌ Error: {url}: {error}")
+        else:
+            print(f"❌ Unexpected error: {url}: {error}")
+            if args.verbose:
+                import traceback
+                traceback.print_exception(type(error), error, error.__traceback__)
+                
+    if failures:
+        print(f"⚠️  {len(urls) - len(failures)} of {len(urls)} components generated")
+        sys.exit(1)
 
 
 def main(argv: Optional[list] = None):
@@ -140,14 +209,14 @@ def main(argv: Optional[list] = None):
     args = parser.parse_args(argv)
     
     # Handle init command
-    if args.url_or_init == 'init':
+    if args.url_or_init == ['init']:
         output_path = args.output or 'dcrawl.config.json'
         handle_init_command(output_path)
         return
     
-    # Handle URL
-    url = args.url_or_init
-    if not url:
+    # Handle URLs
+    urls = args.url_or_init
+    if not urls:
         parser.print_help()
         sys.exit(1)
     
@@ -162,7 +231,7 @@ def main(argv: Optional[list] = None):
     config['headless'] = args.headless
     
     # Create a fake args object for handle_crawl_command
-    args.url = url
+    args.urls = urls
     handle_crawl_command(args, config)
 
 
@@ -1,5 +1,6 @@
 """Utility functions for dcrawl."""
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -8,15 +9,30 @@ import logging
 
 from .exceptions import ConfigError
 
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default configuration values
 DEFAULT_CONFIG = {
     "headless": True,
     "timeout": 30000,
+    "block_css": False,
+    "concurrency": 4,
     "component_name": "GeneratedComponent",
     "output_dir": "./generated",
     "max_elements_per_category": 10
 }
 
+# URL prefixes accepted by validate_url
+URL_SCHEMES = ('http://', 'https://')
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
@@ -28,8 +44,8 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def save_file(content: str, filepath: str) -> str:
-    """Save content to file and return the path."""
+def _unique_path(filepath: str) -> Path:
+    """Create the parent directory and return a path that doesn't exist yet."""
     path = Path(filepath)
     
     # Create directory if needed
@@ -43,6 +59,13 @@ def save_file(content: str, filepath: str) -> str:
         while path.exists():
             path = path.parent / f"{stem}_{counter}{suffix}"
             counter += 1
+            
+    return path
+
+
+def save_file(content: str, filepath: str) -> str:
+    """Save content to file and return the path."""
+    path = _unique_path(filepath)
     
     # Save file
     with open(path, 'w', encoding='utf-8') as f:
@@ -51,14 +74,29 @@ def save_file(content: str, filepath: str) -> str:
     return str(path)
 
 
+async def save_file_async(content: str, filepath: str) -> str:
+    """Save content to file without blocking the event loop and return the path."""
+    if aiofiles is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, save_file, content, filepath)
+        
+    path = _unique_path(filepath)
+    
+    # Save file
+    async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+        await f.write(content)
+        
+    return str(path)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from file."""
     if not config_path:
         return DEFAULT_CONFIG.copy()
         
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            user_config = json.load(f)
+        data = Path(config_path).read_bytes()
+        user_config = orjson.loads(data) if orjson else json.loads(data)
         
         # Merge with defaults
         config = DEFAULT_CONFIG.copy()
@@ -75,17 +113,18 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
 def save_default_config(output_path: str = "dcrawl.config.json") -> str:
     """Save default configuration to file."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(DEFAULT_CONFIG, f, indent=2)
+    if orjson:
+        Path(output_path).write_bytes(orjson.dumps(DEFAULT_CONFIG, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(DEFAULT_CONFIG, f, indent=2)
         
     return output_path
 
 
 def validate_url(url: str) -> bool:
     """Validate URL format."""
-    if not url:
-        return False
-    return url.startswith(('http://', 'https://'))
+    return bool(url) and url.startswith(URL_SCHEMES)
 
 
 def get_output_filename(component_name: str, output_dir: str) -> str: